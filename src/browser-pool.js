@@ -0,0 +1,159 @@
+/**
+ * Pool of reusable Chromium instances for rendering
+ */
+
+import { chromium } from 'playwright';
+import { routeFonts } from './fonts.js';
+
+const POOL_SIZE = parseInt(process.env.POOL_SIZE) || 4;
+const MAX_USES_PER_INSTANCE = 100;
+
+// Trim Chromium features a static-page screenshot doesn't need. The pages are
+// built from our own template JSON; Playwright already disables the sandbox.
+const CHROMIUM_ARGS = [
+  '--disable-gpu',
+  '--disable-dev-shm-usage',
+  '--disable-extensions',
+  '--disable-background-networking',
+];
+
+// Idle browsers ready to be handed out: { browser, page, uses }
+const idle = [];
+// Callbacks of callers waiting for a free browser
+const waiting = [];
+// Number of browsers currently launched (idle + in use)
+let launched = 0;
+// Total renders served by the pool
+let totalUses = 0;
+
+async function launchEntry() {
+  const browser = await chromium.launch({ args: CHROMIUM_ARGS });
+  return { browser, page: null, uses: 0 };
+}
+
+/**
+ * Create the long-lived page used for every render on a browser
+ */
+async function createPage(browser) {
+  const page = await browser.newPage();
+  await routeFonts(page);
+  return page;
+}
+
+/**
+ * Take a browser from the pool, launching one if the pool isn't full yet
+ */
+async function acquire() {
+  let entry;
+  while ((entry = idle.pop())) {
+    if (entry.browser.isConnected()) return entry;
+    // Chromium died while idle: drop it and free its slot
+    launched--;
+    entry.browser.close().catch(() => {});
+  }
+
+  if (launched < POOL_SIZE) {
+    launched++;
+    try {
+      return await launchEntry();
+    } catch (error) {
+      launched--;
+      // Let a queued caller retry the launch in the freed slot
+      waiting.shift()?.();
+      throw error;
+    }
+  }
+
+  return new Promise((resolve, reject) => {
+    waiting.push(() => acquire().then(resolve, reject));
+  });
+}
+
+/**
+ * Return a browser to the pool, recycling it once it has been used too often
+ */
+async function release(entry) {
+  entry.uses++;
+  totalUses++;
+
+  if (entry.uses >= MAX_USES_PER_INSTANCE || !entry.browser.isConnected()) {
+    launched--;
+    await entry.browser.close().catch(() => {});
+  } else {
+    idle.push(entry);
+  }
+
+  const next = waiting.shift();
+  if (next) next();
+}
+
+/**
+ * Run fn with a pooled browser's page, returning it to the pool afterwards
+ */
+export async function withPage(fn) {
+  const entry = await acquire();
+  try {
+    if (!entry.page || entry.page.isClosed()) {
+      entry.page = await createPage(entry.browser);
+    }
+    return await fn(entry.page);
+  } finally {
+    await release(entry);
+  }
+}
+
+/**
+ * Launch browsers (with their pages) up front so the first renders don't pay
+ * Chromium's cold start
+ */
+export async function warmPool(size = POOL_SIZE) {
+  const count = Math.min(size, POOL_SIZE) - launched;
+  if (count <= 0) return;
+
+  launched += count;
+  const results = await Promise.allSettled(Array.from({ length: count }, async () => {
+    const entry = await launchEntry();
+    try {
+      entry.page = await createPage(entry.browser);
+    } catch (error) {
+      await entry.browser.close().catch(() => {});
+      throw error;
+    }
+    return entry;
+  }));
+
+  for (const result of results) {
+    if (result.status === 'fulfilled') {
+      idle.push(result.value);
+      const next = waiting.shift();
+      if (next) next();
+    } else {
+      launched--;
+      console.warn(`  Warning: Could not launch browser: ${result.reason.message}`);
+      waiting.shift()?.();
+    }
+  }
+}
+
+/**
+ * Current pool usage, for monitoring
+ */
+export function poolStats() {
+  return {
+    size: POOL_SIZE,
+    launched,
+    idle: idle.length,
+    inUse: launched - idle.length,
+    waiting: waiting.length,
+    uses: totalUses,
+  };
+}
+
+/**
+ * Close all idle browsers (call before exiting in CLI mode)
+ */
+export async function closePool() {
+  const entries = idle.splice(0);
+  launched -= entries.length;
+  await Promise.all(entries.map(({ browser }) => browser.close().catch(() => {})));
+}
@@ -0,0 +1,107 @@
+/**
+ * Local cache for Google Fonts requests made while rendering
+ */
+
+import { fileURLToPath } from 'node:url';
+import { dirname, join } from 'node:path';
+import { readFile, writeFile, mkdir, rename } from 'node:fs/promises';
+import { createHash, randomUUID } from 'node:crypto';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const FONTS_CACHE_DIR = join(__dirname, '..', 'assets', '_fonts');
+
+// In-memory copy of cached responses: url -> Buffer
+const memoryCache = new Map();
+// Loads in progress: url -> Promise (see loadCached)
+const pending = new Map();
+// Font requests that failed per page, since the last takeFontFailures()
+const failures = new WeakMap();
+
+function cachePath(url, ext) {
+  const hash = createHash('sha1').update(url).digest('hex');
+  return join(FONTS_CACHE_DIR, `${hash}.${ext}`);
+}
+
+/**
+ * Write a file atomically (temp file + rename), so readers never see it half-written
+ */
+async function writeAtomic(filePath, data) {
+  const tmpPath = `${filePath}.${randomUUID()}.tmp`;
+  await writeFile(tmpPath, data);
+  await rename(tmpPath, filePath);
+}
+
+async function loadFresh(route, url, ext) {
+  const filePath = cachePath(url, ext);
+  let body;
+  try {
+    body = await readFile(filePath);
+  } catch (_e) {
+    const response = await route.fetch();
+    // Don't keep error responses; the next render retries the network
+    if (!response.ok()) {
+      return { failed: { status: response.status(), headers: response.headers(), body: await response.body() } };
+    }
+
+    body = await response.body();
+    await mkdir(FONTS_CACHE_DIR, { recursive: true });
+    await writeAtomic(filePath, body);
+  }
+
+  memoryCache.set(url, body);
+  return { body };
+}
+
+/**
+ * Load a font resource from memory, disk or (once) the network. Resolves to
+ * { body }, or { failed } with the status, headers and body of an error response.
+ * Concurrent requests for the same URL share one load.
+ */
+function loadCached(route, ext) {
+  const url = route.request().url();
+  if (memoryCache.has(url)) return Promise.resolve({ body: memoryCache.get(url) });
+
+  if (!pending.has(url)) {
+    pending.set(url, loadFresh(route, url, ext).finally(() => pending.delete(url)));
+  }
+  return pending.get(url);
+}
+
+function recordFailure(page) {
+  failures.set(page, (failures.get(page) || 0) + 1);
+}
+
+/**
+ * Return the number of font requests that failed on page, and reset it
+ */
+export function takeFontFailures(page) {
+  const count = failures.get(page) || 0;
+  failures.delete(page);
+  return count;
+}
+
+async function fulfillFrom(page, route, ext, contentType) {
+  try {
+    const { body, failed } = await loadCached(route, ext);
+    if (failed) {
+      recordFailure(page);
+      console.warn(`  Warning: Font request failed (${failed.status}): ${route.request().url()}`);
+      await route.fulfill(failed);
+    } else {
+      await route.fulfill({ body, contentType });
+    }
+  } catch (e) {
+    recordFailure(page);
+    console.warn(`  Warning: Could not load font: ${route.request().url()}`);
+    await route.abort();
+  }
+}
+
+/**
+ * Serve Google Fonts stylesheets and font files from the local cache
+ */
+export async function routeFonts(page) {
+  await page.route('**/fonts.googleapis.com/**', route => fulfillFrom(page, route, 'css', 'text/css'));
+  await page.route('**/fonts.gstatic.com/**', route => fulfillFrom(page, route, 'woff2', 'font/woff2'));
+}
@@ -2,11 +2,15 @@
  * Thumbnail generation using Playwright
  */
 
-import { chromium } from 'playwright';
 import { fileURLToPath } from 'node:url';
-import { dirname, join, basename, resolve } from 'node:path';
-import { readFile, readdir, writeFile, mkdir } from 'node:fs/promises';
+import { dirname, join, basename, resolve, extname } from 'node:path';
+import { readFile, readdir, writeFile, mkdir, stat } from 'node:fs/promises';
 import { existsSync } from 'node:fs';
+import { createHash } from 'node:crypto';
+import { withPage } from './browser-pool.js';
+import { takeFontFailures } from './fonts.js';
+import { renderNative } from './native-renderer.js';
+import { stableStringify, getCachedRender, putCachedRender } from './render-cache.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -14,6 +18,18 @@ const ROOT_DIR = join(__dirname, '..');
 const TEMPLATES_DIR = join(ROOT_DIR, 'templates');
 const OUT_DIR = join(ROOT_DIR, 'out');
 
+// 'native' draws simple templates without a browser, falling back to Playwright
+const RENDERER = process.env.RENDERER || 'browser';
+
+// Bump whenever generated output changes, so older cached renders are ignored
+const RENDER_CACHE_VERSION = 1;
+
+// Output formats; JPEG encodes much faster than Chromium's max-compression PNG
+const JPEG_QUALITY = 85;
+const FORMAT_EXTENSIONS = { png: 'png', jpeg: 'jpg' };
+// Accepted format names (also used for output file extensions)
+const FORMAT_NAMES = { png: 'png', jpeg: 'jpeg', jpg: 'jpeg' };
+
 // Mutable assets directory (can be changed via setAssetsDir)
 let ASSETS_DIR = join(ROOT_DIR, 'assets');
 const DEFAULT_ASSETS_DIR = join(ROOT_DIR, 'assets');
@@ -25,31 +41,127 @@ export function setAssetsDir(dir) {
   ASSETS_DIR = resolve(dir);
 }
 
+// Extensions tried, in order of preference, for asset names given without one
+const PROBE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.svg', '.webp'];
+
+// Per-directory asset indexes, built by a single walk:
+//   byName: file name -> full path
+//   byStem: name without extension -> { path, rank } (rank in PROBE_EXTENSIONS)
+//   mtimeMs, builtAt: directory mtime and time of the walk (see isIndexStale)
+const assetIndexes = new Map();
+// Minimum age before a lookup miss re-walks a directory whose mtime is unchanged
+const ASSET_RESCAN_INTERVAL_MS = 5_000;
+// Set while a file watcher keeps the indexes fresh (see setAssetWatchActive)
+let assetWatchActive = false;
+
 /**
- * Search a directory recursively for a file by name
+ * Walk a directory recursively, recording the first path seen for each file
+ * name and the best-ranked image for each extensionless name
  */
-async function searchDir(dir, fileName) {
+async function indexDir(dir, index) {
   try {
     const entries = await readdir(dir, { withFileTypes: true });
     for (const entry of entries) {
       const fullPath = join(dir, entry.name);
       if (entry.isDirectory()) {
-        const found = await searchDir(fullPath, fileName);
-        if (found) return found;
-      } else if (entry.name === fileName) {
-        return fullPath;
+        await indexDir(fullPath, index);
+        continue;
+      }
+
+      if (!index.byName.has(entry.name)) {
+        index.byName.set(entry.name, fullPath);
+      }
+
+      const ext = extname(entry.name);
+      const rank = PROBE_EXTENSIONS.indexOf(ext);
+      if (rank !== -1) {
+        const stem = entry.name.slice(0, -ext.length);
+        const current = index.byStem.get(stem);
+        if (!current || rank < current.rank) {
+          index.byStem.set(stem, { path: fullPath, rank });
+        }
       }
     }
   } catch (_e) {
     // Directory doesn't exist
   }
-  return null;
+  return index;
+}
+
+async function dirMtime(dir) {
+  try {
+    return (await stat(dir)).mtimeMs;
+  } catch (_e) {
+    return 0;
+  }
+}
+
+async function buildAssetIndex(dir) {
+  const index = { byName: new Map(), byStem: new Map(), mtimeMs: await dirMtime(dir), builtAt: Date.now() };
+  return indexDir(dir, index);
+}
+
+function getAssetIndex(dir) {
+  if (!assetIndexes.has(dir)) {
+    assetIndexes.set(dir, buildAssetIndex(dir));
+  }
+  return assetIndexes.get(dir);
+}
+
+/**
+ * Whether a directory may have changed since its index was built: its mtime
+ * moved (top-level add/remove), or the index is old enough to re-check nested dirs
+ */
+async function isIndexStale(dir) {
+  const index = await assetIndexes.get(dir);
+  if (!index) return true;
+  if (Date.now() - index.builtAt >= ASSET_RESCAN_INTERVAL_MS) return true;
+  return (await dirMtime(dir)) !== index.mtimeMs;
+}
+
+/**
+ * Tell findAsset whether a file watcher is calling invalidateAssetIndex() on
+ * changes, in which case lookup misses don't re-walk the asset directories
+ */
+export function setAssetWatchActive(active) {
+  assetWatchActive = active;
+}
+
+/**
+ * Drop the cached asset indexes so they are rebuilt on next lookup (call when
+ * asset files change)
+ */
+export function invalidateAssetIndex() {
+  assetIndexes.clear();
+  // Compiled templates embed resolved asset data
+  compiledTemplates.clear();
+}
+
+/**
+ * Look up a file name in the indexes, trying common extensions if it has none
+ */
+function lookupAsset(indexes, fileName) {
+  for (const index of indexes) {
+    const found = index.byName.get(fileName);
+    if (found) return found;
+  }
+
+  // Best-ranked extension wins; on a tie the earlier directory wins
+  let best = null;
+  if (!fileName.includes('.')) {
+    for (const index of indexes) {
+      const match = index.byStem.get(fileName);
+      if (match && (!best || match.rank < best.rank)) best = match;
+    }
+  }
+
+  return best ? best.path : null;
 }
 
 /**
  * Find an asset by name or path, searching all asset directories
  */
-async function findAsset(name) {
+export async function findAsset(name) {
   // Extract just the filename for searching
   const fileName = name.includes('/') ? name.split('/').pop() : name;
 
@@ -65,23 +177,20 @@ async function findAsset(name) {
     }
   }
 
-  // Search recursively by filename
-  for (const dir of dirs) {
-    const found = await searchDir(dir, fileName);
-    if (found) return found;
-  }
+  // Look up by filename in the index
+  let found = lookupAsset(await Promise.all(dirs.map(getAssetIndex)), fileName);
+  const vanished = found && !existsSync(found);
+  if (!vanished && (found || assetWatchActive)) return found;
 
-  // Try with common extensions if no extension provided
-  if (!fileName.includes('.')) {
-    for (const ext of ['.png', '.jpg', '.jpeg', '.svg', '.webp']) {
-      for (const dir of dirs) {
-        const found = await searchDir(dir, fileName + ext);
-        if (found) return found;
-      }
-    }
-  }
+  // Rebuild stale indexes once: always if the hit was deleted, otherwise (no
+  // watcher) only directories that may have changed since their last walk.
+  // Compiled templates are left alone; they check their own assets (assetStamp).
+  const stale = await Promise.all(dirs.map(dir => (vanished ? true : isIndexStale(dir))));
+  if (!stale.includes(true)) return null;
 
-  return null;
+  dirs.forEach((dir, i) => stale[i] && assetIndexes.delete(dir));
+  found = lookupAsset(await Promise.all(dirs.map(getAssetIndex)), fileName);
+  return found && existsSync(found) ? found : null;
 }
 
 /**
@@ -115,6 +224,13 @@ async function fileToDataURL(filePath) {
   }
 }
 
+/**
+ * Asset name for an image element: assetPath, or the name extracted from src
+ */
+function assetName(el) {
+  return el.assetPath || (el.src || '').replace(/^\/assets\//, '').replace(/^file:\/\//, '');
+}
+
 /**
  * Resolve image source to a data URL or keep as-is if already data URL
  */
@@ -126,8 +242,7 @@ async function resolveImageSrc(el) {
     return src;
   }
 
-  // Use assetPath or extract name from src
-  const name = el.assetPath || src.replace(/^\/assets\//, '').replace(/^file:\/\//, '');
+  const name = assetName(el);
   const filePath = await findAsset(name);
 
   if (filePath) {
@@ -139,32 +254,48 @@ async function resolveImageSrc(el) {
 }
 
 /**
- * Generate HTML from template data
+ * Read an image element's bytes from its data URL or asset file
  */
-async function generateHTML(templateData) {
-  const { canvas, elements } = templateData;
+async function loadImageData(el) {
+  const src = el.src || '';
 
-  let elementsHTML = '';
+  if (src.startsWith('data:')) {
+    const comma = src.indexOf(',');
+    const payload = src.slice(comma + 1);
+    return src.slice(0, comma).endsWith(';base64')
+      ? Buffer.from(payload, 'base64')
+      : Buffer.from(decodeURIComponent(payload));
+  }
 
-  for (const el of elements) {
-    const style = `left: ${el.x}px; top: ${el.y}px; width: ${el.width}px; height: ${el.height}px;`;
-
-    if (el.type === 'text') {
-      const align = el.textAlign || 'left';
-      const textStyle = `${style} font-size: ${el.fontSize || 48}px; font-weight: ${el.fontWeight || 700}; color: ${el.color || '#ffffff'}; font-family: ${el.fontFamily || 'Inter'};`;
-      elementsHTML += `        <div class="element element-text align-${align}" style="${textStyle}">${el.content || ''}</div>\n`;
-    } else if (el.type === 'image') {
-      const src = await resolveImageSrc(el);
-      if (src) {
-        elementsHTML += `        <div class="element element-image" style="${style}"><img src="${src}"></div>\n`;
-      }
-    } else if (el.type === 'shape') {
-      const shapeStyle = `${style} background: ${el.color || '#4ecca3'}; border-radius: ${el.borderRadius || '0'};`;
-      elementsHTML += `        <div class="element element-shape" style="${shapeStyle}"></div>\n`;
+  const name = assetName(el);
+  const filePath = await findAsset(name);
+
+  if (filePath) {
+    try {
+      return await readFile(filePath);
+    } catch (e) {
+      console.warn(`  Warning: Could not read file: ${filePath}`);
+      return null;
     }
   }
 
-  return `<!DOCTYPE html>
+  console.warn(`  Warning: Asset not found: ${name}`);
+  return null;
+}
+
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' };
+const HTML_SPECIAL = /[&<>"]/;
+
+/**
+ * Escape text for HTML, returning strings without special characters as-is
+ */
+function escapeHTML(text) {
+  if (!HTML_SPECIAL.test(text)) return text;
+  return text.replace(/[&<>"]/g, ch => HTML_ESCAPES[ch]);
+}
+
+// Static part of the document head, shared by every render
+const DOCUMENT_HEAD = `<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -172,15 +303,12 @@ async function generateHTML(templateData) {
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
         body {
-            width: ${canvas.width}px;
-            height: ${canvas.height}px;
             overflow: hidden;
             font-family: 'Inter', sans-serif;
         }
         .canvas {
             width: 100%;
             height: 100%;
-            background: ${canvas.background};
             position: relative;
         }
         .element {
@@ -201,6 +329,16 @@ async function generateHTML(templateData) {
             object-fit: contain;
         }
     </style>
+`;
+
+/**
+ * Wrap rendered elements in the full HTML document for a canvas
+ */
+function renderDocument(canvas, elementsHTML) {
+  return `${DOCUMENT_HEAD}    <style>
+        body { width: ${canvas.width}px; height: ${canvas.height}px; }
+        .canvas { background: ${canvas.background}; }
+    </style>
 </head>
 <body>
     <div class="canvas">
@@ -209,29 +347,245 @@ ${elementsHTML}    </div>
 </html>`;
 }
 
+function elementStyle(el) {
+  return `left: ${el.x}px; top: ${el.y}px; width: ${el.width}px; height: ${el.height}px;`;
+}
+
+async function renderText(el) {
+  const align = el.textAlign || 'left';
+  const textStyle = `${elementStyle(el)} font-size: ${el.fontSize || 48}px; font-weight: ${el.fontWeight || 700}; color: ${el.color || '#ffffff'}; font-family: ${el.fontFamily || 'Inter'};`;
+  return `        <div class="element element-text align-${align}" style="${textStyle}">${escapeHTML(String(el.content || ''))}</div>\n`;
+}
+
+async function renderImage(el) {
+  const src = await resolveImageSrc(el);
+  if (!src) return '';
+  return `        <div class="element element-image" style="${elementStyle(el)}"><img src="${src}"></div>\n`;
+}
+
+async function renderShape(el) {
+  const shapeStyle = `${elementStyle(el)} background: ${el.color || '#4ecca3'}; border-radius: ${el.borderRadius || '0'};`;
+  return `        <div class="element element-shape" style="${shapeStyle}"></div>\n`;
+}
+
+// Element type -> HTML renderer
+const ELEMENT_RENDERERS = {
+  text: renderText,
+  image: renderImage,
+  shape: renderShape,
+};
+
 /**
- * Generate thumbnail from template data (returns PNG buffer)
+ * Render a single element to its HTML markup (unknown types render nothing)
  */
-export async function generateThumbnail(templateData) {
-  const html = await generateHTML(templateData);
-  const { canvas } = templateData;
+async function renderElement(el) {
+  const render = ELEMENT_RENDERERS[el.type];
+  return render ? render(el) : '';
+}
 
-  const browser = await chromium.launch();
-  const page = await browser.newPage({
-    viewport: { width: canvas.width, height: canvas.height },
+/**
+ * Generate HTML from template data
+ */
+async function generateHTML(templateData) {
+  const { canvas, elements } = templateData;
+
+  // Render elements concurrently (image files are read in parallel) and join once
+  const parts = await Promise.all(elements.map(renderElement));
+
+  return renderDocument(canvas, parts.join(''));
+}
+
+/**
+ * Apply per-element overrides, keyed by element index ({ [index]: { content, color, src, ... } }).
+ * Overriding an image's src drops its assetPath, which would otherwise take precedence.
+ */
+function applyOverrides(elements, overrides) {
+  return elements.map((el, i) => {
+    const override = overrides[i];
+    if (!override) return el;
+
+    const merged = { ...el, ...override };
+    if ('src' in override && !('assetPath' in override)) delete merged.assetPath;
+    return merged;
   });
+}
+
+/**
+ * Stamp of the asset files referenced by elements (path and mtime of each), so
+ * edits to an asset in place can be detected
+ */
+async function assetStamp(elements) {
+  const stamps = [];
 
-  await page.setContent(html);
-  await page.waitForLoadState('networkidle');
+  for (const el of elements) {
+    if (el.type !== 'image' || (el.src || '').startsWith('data:')) continue;
 
-  const screenshot = await page.screenshot({ type: 'png' });
-  await browser.close();
+    const filePath = await findAsset(assetName(el));
+    if (filePath) {
+      const { mtimeMs } = await stat(filePath);
+      stamps.push(`${filePath}:${mtimeMs}`);
+    }
+  }
 
-  return screenshot;
+  return stamps.join('\0');
 }
 
 /**
- * Generate thumbnail from a template file
+ * Compile template data into a renderer specialised for it. Element markup
+ * (including base64-encoded images) is built on the first call and reused;
+ * calling the returned function with overrides only re-renders the overridden
+ * elements. Nothing is encoded until a render actually needs the HTML.
+ */
+export async function compileTemplate(templateData) {
+  const { canvas, elements } = templateData;
+  let parts = null;
+
+  return async (overrides = {}) => {
+    if (!parts) {
+      parts = Promise.all(elements.map(renderElement));
+      // Retry on the next call rather than keeping a failure
+      parts.catch(() => { parts = null; });
+    }
+    const base = await parts;
+    const rendered = await Promise.all(applyOverrides(elements, overrides)
+      .map((el, i) => (el === elements[i] ? base[i] : renderElement(el))));
+    return renderDocument(canvas, rendered.join(''));
+  };
+}
+
+// Compiled templates by file path: { content, entry } where entry is a promise
+// of { templateData, stamp, render }
+const compiledTemplates = new Map();
+
+async function compileEntry(content) {
+  const templateData = JSON.parse(content);
+  const stamp = await assetStamp(templateData.elements);
+  return { templateData, stamp, render: await compileTemplate(templateData) };
+}
+
+/**
+ * Parse and compile a template file, reusing the previous compile while the
+ * file content and the assets it references are unchanged
+ */
+async function loadCompiledTemplate(templatePath) {
+  const content = await readFile(templatePath, 'utf-8');
+
+  const compiled = compiledTemplates.get(templatePath);
+  if (compiled && compiled.content === content) {
+    const entry = await compiled.entry;
+    if (await assetStamp(entry.templateData.elements) === entry.stamp) return entry;
+  }
+
+  // Concurrent renders of the same template share one compile
+  const entry = compileEntry(content);
+  const fresh = { content, entry };
+  compiledTemplates.set(templatePath, fresh);
+  entry.catch(() => {
+    if (compiledTemplates.get(templatePath) === fresh) compiledTemplates.delete(templatePath);
+  });
+
+  return entry;
+}
+
+/**
+ * Cache key for a render: hash of the template data plus the mtimes of the
+ * asset files it references, so edited assets invalidate the entry
+ */
+async function renderCacheKey(templateData, format) {
+  const hash = createHash('blake2b512');
+  hash.update(`${RENDER_CACHE_VERSION}:${RENDERER}:${format}`);
+  hash.update(stableStringify(templateData));
+  hash.update(await assetStamp(templateData.elements));
+
+  return hash.digest('hex').slice(0, 32);
+}
+
+/**
+ * Normalise a format name ('png', 'jpeg' or 'jpg'), throwing on anything else
+ */
+export function parseFormat(name) {
+  const format = FORMAT_NAMES[String(name).toLowerCase()];
+  if (!format) {
+    throw new Error(`Unsupported format: ${name} (expected png or jpeg)`);
+  }
+  return format;
+}
+
+/**
+ * Output format from an explicit format and/or the output path's extension,
+ * rejecting unsupported extensions and formats that contradict the extension
+ */
+export function resolveOutputFormat(format, outputPath) {
+  const ext = outputPath ? extname(outputPath).slice(1) : '';
+  const extFormat = ext ? FORMAT_NAMES[ext.toLowerCase()] : null;
+  if (ext && !extFormat) {
+    throw new Error(`Unsupported output file extension: ${outputPath} (expected .png, .jpg or .jpeg)`);
+  }
+
+  if (!format) return extFormat || 'png';
+
+  const requested = parseFormat(format);
+  if (extFormat && extFormat !== requested) {
+    throw new Error(`Format ${format} conflicts with output file ${outputPath}`);
+  }
+  return requested;
+}
+
+/**
+ * Generate thumbnail from template data (returns PNG or JPEG buffer), reusing
+ * a previous render of identical data when one is cached
+ */
+export async function generateThumbnail(templateData, options = {}) {
+  const format = parseFormat(options.format || 'png');
+
+  const key = `${await renderCacheKey(templateData, format)}.${FORMAT_EXTENSIONS[format]}`;
+  const cached = await getCachedRender(key);
+  if (cached) return cached;
+
+  const { image, fontsLoaded } = await renderThumbnail(templateData, format, options.renderHTML);
+  // Don't persist renders that fell back to a substitute font
+  if (fontsLoaded) await putCachedRender(key, image);
+  return image;
+}
+
+/**
+ * Render template data to an image buffer in the given format
+ * (renderHTML builds the page for the browser path; defaults to generateHTML).
+ * Resolves to { image, fontsLoaded }.
+ */
+async function renderThumbnail(templateData, format, renderHTML = generateHTML) {
+  if (RENDERER === 'native') {
+    // The native renderer only draws text in fonts it has registered
+    const image = await renderNative(templateData, loadImageData, { format, quality: JPEG_QUALITY });
+    if (image) return { image, fontsLoaded: true };
+  }
+
+  const html = await renderHTML(templateData);
+  const { canvas } = templateData;
+
+  return withPage(async (page) => {
+    await page.setViewportSize({ width: canvas.width, height: canvas.height });
+    await page.setContent(html, { waitUntil: 'domcontentloaded', timeout: 3000 });
+    takeFontFailures(page);
+
+    // Wait for fonts and decoded images rather than for the network to go idle
+    const fontErrors = await page.evaluate(() => Promise.all([
+      document.fonts.ready,
+      ...Array.from(document.images, img => img.decode().catch(() => {})),
+    ]).then(() => Array.from(document.fonts).filter(font => font.status === 'error').length));
+
+    const image = await page.screenshot(format === 'jpeg'
+      ? { type: 'jpeg', quality: JPEG_QUALITY }
+      : { type: 'png' });
+
+    return { image, fontsLoaded: fontErrors === 0 && takeFontFailures(page) === 0 };
+  });
+}
+
+/**
+ * Generate thumbnail from a template file (JPEG when options.format is 'jpeg'
+ * or the output path ends in .jpg/.jpeg, PNG otherwise; see resolveOutputFormat). options.overrides
+ * maps element indexes to replacement properties, e.g. { 2: { content: '...' } }.
  */
 export async function generateFromTemplate(templatePath, outputPath, options = {}) {
   // Set custom assets directory if provided
@@ -255,19 +609,84 @@ export async function generateFromTemplate(templatePath, outputPath, options = {
 
   console.log(`Loading template: ${fullTemplatePath}`);
 
-  const content = await readFile(fullTemplatePath, 'utf-8');
-  const templateData = JSON.parse(content);
+  const { templateData, render } = await loadCompiledTemplate(fullTemplatePath);
+  const overrides = options.overrides || {};
+
+  const format = resolveOutputFormat(options.format, outputPath);
 
-  // generateHTML will handle resolving image paths to base64
-  const pngBuffer = await generateThumbnail(templateData);
+  // The compiled template has already resolved image paths to base64
+  const imageBuffer = await generateThumbnail(
+    { ...templateData, elements: applyOverrides(templateData.elements, overrides) },
+    { format, renderHTML: () => render(overrides) },
+  );
 
   // Determine output path
   if (!outputPath) {
-    await mkdir(OUT_DIR, { recursive: true });
+    const outDir = options.outDir || OUT_DIR;
+    await mkdir(outDir, { recursive: true });
     const templateName = basename(fullTemplatePath, '.json');
-    outputPath = join(OUT_DIR, `${templateName}.png`);
+    outputPath = join(outDir, `${templateName}.${FORMAT_EXTENSIONS[format] || 'png'}`);
   }
 
-  await writeFile(outputPath, pngBuffer);
+  await writeFile(outputPath, imageBuffer);
   return outputPath;
 }
+
+/**
+ * Generate thumbnails from several template files, rendering them concurrently
+ * on the shared browser pool. Output goes to <outDir>/<template-name>.<ext>
+ * (outDir defaults to out/). Resolves to { templatePath, outputPath } or
+ * { templatePath, error } per template; one failure doesn't stop the others.
+ */
+export async function generateFromTemplates(templatePaths, options = {}) {
+  // Outputs are named after the template, so two templates can't share a name
+  const names = new Map();
+  for (const templatePath of templatePaths) {
+    const name = basename(templatePath, '.json');
+    if (names.has(name)) {
+      throw new Error(`Templates ${names.get(name)} and ${templatePath} would both be saved as ${name}`);
+    }
+    names.set(name, templatePath);
+  }
+
+  const { assetsDir, ...rest } = options;
+  if (assetsDir) {
+    setAssetsDir(assetsDir);
+    console.log(`Assets directory: ${ASSETS_DIR}`);
+  }
+
+  const results = await Promise.allSettled(
+    templatePaths.map(templatePath => generateFromTemplate(templatePath, null, rest)),
+  );
+
+  return results.map((result, i) => (result.status === 'fulfilled'
+    ? { templatePath: templatePaths[i], outputPath: result.value }
+    : { templatePath: templatePaths[i], error: result.reason }));
+}
+
+/**
+ * Render one template once per override set, reusing its compiled form.
+ * Output goes to <outDir>/<template-name>-<n>.<ext> (outDir defaults to out/).
+ * Resolves to { templatePath, variant, outputPath } or { templatePath, variant, error }.
+ */
+export async function generateVariants(templatePath, overrideSets, options = {}) {
+  const { assetsDir, outDir = OUT_DIR, ...rest } = options;
+  const format = resolveOutputFormat(rest.format);
+  if (assetsDir) {
+    setAssetsDir(assetsDir);
+    console.log(`Assets directory: ${ASSETS_DIR}`);
+  }
+
+  await mkdir(outDir, { recursive: true });
+  const name = basename(templatePath, '.json');
+
+  const results = await Promise.allSettled(overrideSets.map((overrides, i) => generateFromTemplate(
+    templatePath,
+    join(outDir, `${name}-${i + 1}.${FORMAT_EXTENSIONS[format]}`),
+    { ...rest, format, overrides },
+  )));
+
+  return results.map((result, i) => (result.status === 'fulfilled'
+    ? { templatePath, variant: i + 1, outputPath: result.value }
+    : { templatePath, variant: i + 1, error: result.reason }));
+}
@@ -5,13 +5,17 @@
  */
 
 import { parseArgs } from 'node:util';
+import { readFile } from 'node:fs/promises';
 import { startServer } from './server.js';
-import { generateFromTemplate } from './generator.js';
+import { generateFromTemplate, generateFromTemplates, generateVariants, resolveOutputFormat } from './generator.js';
+import { closePool } from './browser-pool.js';
 
 const options = {
   editor: { type: 'boolean', default: false },
-  template: { type: 'string', short: 't' },
+  template: { type: 'string', short: 't', multiple: true },
   output: { type: 'string', short: 'o' },
+  format: { type: 'string', short: 'f' },
+  overrides: { type: 'string' },
   port: { type: 'string', default: '8080' },
   'assets-dir': { type: 'string', short: 'a' },
   help: { type: 'boolean', short: 'h' },
@@ -28,20 +32,46 @@ Usage:
 
 Options:
   --editor            Launch the visual editor in browser
-  --template, -t      Template JSON file to generate from
-  --output, -o        Output file path (default: out/<template-name>.png)
+  --template, -t      Template JSON file to generate from (repeatable)
+  --output, -o        Output file path (default: out/<template-name>.png),
+                      or output directory when several templates or variants are given
+  --format, -f        Output format: png or jpeg (default: from output extension, else png);
+                      must match the output extension if both are given
+  --overrides         JSON file of element overrides keyed by element index (one template only),
+                      e.g. {"2": {"content": "Two Sum"}}; a list of such objects
+                      renders one variant per entry (out/<template-name>-<n>.png)
   --port              Server port (default: 8080)
   --assets-dir, -a    Custom assets directory (default: ./assets)
   --help, -h          Show this help message
 
+Environment:
+  RENDERER=native     Draw simple templates without a browser
+                      (requires: npm install @napi-rs/canvas)
+  POOL_SIZE           Number of pooled Chromium browsers (default: 4)
+  RENDER_CACHE_SIZE   Rendered thumbnails kept in out/.cache (default: 200)
+
 Examples:
   npm run editor
   npm run editor -- --assets-dir ~/projects/transcripts
   npm start -- -t templates/leetcode.json
   npm start -- -t leetcode.json -o out/my-thumbnail.png -a /path/to/images
+  npm start -- -t leetcode.json -t python.json -o out/batch
+  npm start -- -t leetcode.json -o out/preview.jpg
+  npm start -- -t leetcode.json --overrides titles.json
 `);
 }
 
+function isPlainObject(value) {
+  return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
+/**
+ * Check an override set: an object mapping element indexes to objects of properties
+ */
+function isOverrideSet(value) {
+  return isPlainObject(value) && Object.values(value).every(isPlainObject);
+}
+
 async function main() {
   const { values } = parseArgs({ options, allowPositionals: true });
 
@@ -52,6 +82,7 @@ async function main() {
 
   // Resolve assets directory (can be absolute or relative)
   const assetsDir = values['assets-dir'] || null;
+  const format = values.format || null;
 
   if (values.editor || (!values.template && !values.help)) {
     // Default to editor mode
@@ -62,11 +93,48 @@ async function main() {
 
   if (values.template) {
     try {
-      const outputPath = await generateFromTemplate(values.template, values.output, { assetsDir });
-      console.log(`Thumbnail saved to: ${outputPath}`);
+      // Overrides file: one override set, or a list of sets to render variants.
+      // Element indexes are per template, so it only applies to a single one.
+      if (values.overrides && values.template.length > 1) {
+        throw new Error('--overrides can only be used with a single template');
+      }
+      const overrides = values.overrides
+        ? JSON.parse(await readFile(values.overrides, 'utf-8'))
+        : {};
+      const variants = Array.isArray(overrides);
+      if (!(variants ? overrides.every(isOverrideSet) : isOverrideSet(overrides))) {
+        throw new Error(`${values.overrides} must contain an object of per-element overrides ({"<index>": {...}}) or a list of them`);
+      }
+
+      // Reject bad --format / output extension combinations before rendering
+      if (values.template.length === 1 && !variants) resolveOutputFormat(format, values.output);
+      else if (format) resolveOutputFormat(format);
+
+      // With several outputs, --output is the directory to write into
+      let results;
+      if (variants) {
+        results = await generateVariants(values.template[0], overrides, { assetsDir, format, outDir: values.output });
+      } else if (values.template.length === 1) {
+        const outputPath = await generateFromTemplate(values.template[0], values.output, { assetsDir, format, overrides });
+        results = [{ templatePath: values.template[0], outputPath }];
+      } else {
+        results = await generateFromTemplates(values.template, { assetsDir, format, outDir: values.output });
+      }
+
+      for (const { templatePath, variant, outputPath, error } of results) {
+        if (error) {
+          const label = variant ? `${templatePath} #${variant}` : templatePath;
+          console.error(`Error generating ${label}:`, error.message);
+          process.exitCode = 1;
+        } else {
+          console.log(`Thumbnail saved to: ${outputPath}`);
+        }
+      }
     } catch (error) {
       console.error('Error generating thumbnail:', error.message);
       process.exit(1);
+    } finally {
+      await closePool();
     }
     return;
   }
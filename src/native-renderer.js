@@ -0,0 +1,176 @@
+/**
+ * Direct canvas renderer for simple templates (no browser involved)
+ *
+ * Handles plain-colour backgrounds, shapes, images (object-fit: contain) and
+ * text blocks. Returns null whenever a template uses something it can't draw
+ * faithfully, so the caller can fall back to the Playwright renderer.
+ */
+
+import { fileURLToPath } from 'node:url';
+import { dirname, join } from 'node:path';
+import { readdir } from 'node:fs/promises';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const FONTS_DIR = join(__dirname, '..', 'assets', '_fonts');
+
+const PLAIN_COLOR = /^(#[0-9a-f]{3,8}|(rgb|hsl)a?\([^()]*\)|[a-z]+)$/i;
+const PX_LENGTH = /^\d+(\.\d+)?(px)?$/;
+const FONT_FILE = /\.(woff2?|ttf|otf)$/i;
+const LINE_HEIGHT = 1.2;
+
+// Lazily loaded @napi-rs/canvas module (null if not installed)
+let canvasModule;
+
+async function loadCanvasModule() {
+  if (canvasModule !== undefined) return canvasModule;
+
+  try {
+    canvasModule = await import('@napi-rs/canvas');
+  } catch (_e) {
+    canvasModule = null;
+    return null;
+  }
+
+  // Register cached fonts (see fonts.js) so text can use the same typeface
+  try {
+    for (const file of await readdir(FONTS_DIR)) {
+      if (FONT_FILE.test(file)) {
+        canvasModule.GlobalFonts.registerFromPath(join(FONTS_DIR, file));
+      }
+    }
+  } catch (_e) {
+    // No cached fonts yet
+  }
+
+  return canvasModule;
+}
+
+function isPlainColor(value) {
+  return PLAIN_COLOR.test(String(value).trim());
+}
+
+/**
+ * Check whether every element can be drawn without a browser
+ */
+function isSupported(templateData, GlobalFonts) {
+  const { canvas, elements } = templateData;
+  if (!isPlainColor(canvas.background)) return false;
+
+  return elements.every((el) => {
+    if (el.type === 'text') {
+      return isPlainColor(el.color || '#ffffff') && GlobalFonts.has(el.fontFamily || 'Inter');
+    }
+    if (el.type === 'shape') {
+      return isPlainColor(el.color || '#4ecca3') && PX_LENGTH.test(String(el.borderRadius || '0'));
+    }
+    return el.type === 'image';
+  });
+}
+
+/**
+ * Split text into lines that fit the given width (white-space: pre-wrap; word-break: break-word)
+ */
+function wrapText(ctx, text, maxWidth) {
+  const lines = [];
+
+  for (const paragraph of text.split('\n')) {
+    let line = '';
+    for (const word of paragraph.split(/(?<=\s)/)) {
+      if (ctx.measureText(line + word).width <= maxWidth) {
+        line += word;
+        continue;
+      }
+      if (line) lines.push(line.trimEnd());
+      line = '';
+      // Break words that are wider than the box on their own
+      for (const ch of word) {
+        if (line && ctx.measureText(line + ch).width > maxWidth) {
+          lines.push(line);
+          line = '';
+        }
+        line += ch;
+      }
+    }
+    lines.push(line.trimEnd());
+  }
+
+  return lines;
+}
+
+async function drawText(ctx, el) {
+  const fontSize = el.fontSize || 48;
+  const align = el.textAlign || 'left';
+  const lineHeight = fontSize * LINE_HEIGHT;
+
+  ctx.font = `${el.fontWeight || 700} ${fontSize}px ${el.fontFamily || 'Inter'}`;
+  ctx.fillStyle = el.color || '#ffffff';
+  ctx.textAlign = align;
+  ctx.textBaseline = 'middle';
+
+  const lines = wrapText(ctx, String(el.content || ''), el.width);
+  const x = align === 'center' ? el.x + el.width / 2 : align === 'right' ? el.x + el.width : el.x;
+  // Lines are vertically centred in the box (align-items: center)
+  let y = el.y + (el.height - lines.length * lineHeight) / 2 + lineHeight / 2;
+
+  for (const line of lines) {
+    ctx.fillText(line, x, y);
+    y += lineHeight;
+  }
+}
+
+async function drawShape(ctx, el) {
+  ctx.fillStyle = el.color || '#4ecca3';
+  ctx.beginPath();
+  ctx.roundRect(el.x, el.y, el.width, el.height, parseFloat(el.borderRadius) || 0);
+  ctx.fill();
+}
+
+async function drawImage(ctx, el, { loadImage, loadImageData }) {
+  const data = await loadImageData(el);
+  if (!data) return;
+
+  let image;
+  try {
+    image = await loadImage(data);
+  } catch (_e) {
+    console.warn(`  Warning: Could not decode image: ${el.assetPath || el.src}`);
+    return;
+  }
+
+  // object-fit: contain
+  const scale = Math.min(el.width / image.width, el.height / image.height);
+  const width = image.width * scale;
+  const height = image.height * scale;
+  ctx.drawImage(image, el.x + (el.width - width) / 2, el.y + (el.height - height) / 2, width, height);
+}
+
+// Element type -> canvas drawing function
+const ELEMENT_DRAWERS = {
+  text: drawText,
+  image: drawImage,
+  shape: drawShape,
+};
+
+/**
+ * Render template data straight to a PNG/JPEG buffer, or return null if unsupported.
+ * loadImageData(el) must resolve an image element to a Buffer (or null).
+ */
+export async function renderNative(templateData, loadImageData, { format = 'png', quality = 85 } = {}) {
+  const mod = await loadCanvasModule();
+  if (!mod || !isSupported(templateData, mod.GlobalFonts)) return null;
+
+  const { canvas, elements } = templateData;
+  const surface = mod.createCanvas(canvas.width, canvas.height);
+  const ctx = surface.getContext('2d');
+
+  ctx.fillStyle = canvas.background;
+  ctx.fillRect(0, 0, canvas.width, canvas.height);
+
+  const helpers = { loadImage: mod.loadImage, loadImageData };
+  for (const el of elements) {
+    await ELEMENT_DRAWERS[el.type](ctx, el, helpers);
+  }
+
+  return format === 'jpeg' ? surface.encode('jpeg', quality) : surface.encode('png');
+}
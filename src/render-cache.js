@@ -0,0 +1,80 @@
+/**
+ * Content-addressed on-disk cache of rendered thumbnails
+ */
+
+import { fileURLToPath } from 'node:url';
+import { dirname, join } from 'node:path';
+import { readFile, writeFile, mkdir, readdir, rename, stat, unlink, utimes } from 'node:fs/promises';
+import { randomUUID } from 'node:crypto';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const CACHE_DIR = join(__dirname, '..', 'out', '.cache');
+const MAX_CACHE_ENTRIES = parseInt(process.env.RENDER_CACHE_SIZE) || 200;
+
+/**
+ * JSON.stringify with object keys sorted, so equal data gives equal strings
+ */
+export function stableStringify(value) {
+  if (Array.isArray(value)) {
+    return `[${value.map(stableStringify).join(',')}]`;
+  }
+  if (value && typeof value === 'object') {
+    const keys = Object.keys(value).filter(k => value[k] !== undefined).sort();
+    return `{${keys.map(k => `${JSON.stringify(k)}:${stableStringify(value[k])}`).join(',')}}`;
+  }
+  return JSON.stringify(value) ?? 'null';
+}
+
+/**
+ * Return the cached render stored under file name key, or null on a miss
+ */
+export async function getCachedRender(key) {
+  const filePath = join(CACHE_DIR, key);
+  try {
+    const data = await readFile(filePath);
+    // Bump mtime so eviction drops least recently used entries first
+    const now = new Date();
+    await utimes(filePath, now, now).catch(() => {});
+    return data;
+  } catch (_e) {
+    return null;
+  }
+}
+
+/**
+ * Store a render under key, evicting the oldest entries beyond the size limit
+ */
+export async function putCachedRender(key, data) {
+  try {
+    await mkdir(CACHE_DIR, { recursive: true });
+    // Write to a temp file and rename, so readers never see a partial image
+    const tmpPath = join(CACHE_DIR, `${key}.${randomUUID()}.tmp`);
+    try {
+      await writeFile(tmpPath, data);
+      await rename(tmpPath, join(CACHE_DIR, key));
+    } catch (e) {
+      await unlink(tmpPath).catch(() => {});
+      throw e;
+    }
+    await evict();
+  } catch (e) {
+    console.warn(`  Warning: Could not write render cache: ${e.message}`);
+  }
+}
+
+async function evict() {
+  // Skip temp files of writes still in progress
+  const files = (await readdir(CACHE_DIR)).filter(file => !file.endsWith('.tmp'));
+  if (files.length <= MAX_CACHE_ENTRIES) return;
+
+  const entries = await Promise.all(files.map(async (file) => {
+    const filePath = join(CACHE_DIR, file);
+    const { mtimeMs } = await stat(filePath).catch(() => ({ mtimeMs: 0 }));
+    return { filePath, mtimeMs };
+  }));
+
+  entries.sort((a, b) => a.mtimeMs - b.mtimeMs);
+  const stale = entries.slice(0, entries.length - MAX_CACHE_ENTRIES);
+  await Promise.all(stale.map(({ filePath }) => unlink(filePath).catch(() => {})));
+}
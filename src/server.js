@@ -5,9 +5,10 @@
 import express from 'express';
 import { fileURLToPath } from 'node:url';
 import { dirname, join, extname, resolve } from 'node:path';
-import { readdir, readFile } from 'node:fs/promises';
-import { existsSync } from 'node:fs';
-import { generateThumbnail, setAssetsDir } from './generator.js';
+import { readdir } from 'node:fs/promises';
+import { existsSync, watch } from 'node:fs';
+import { generateThumbnail, parseFormat, setAssetsDir, findAsset, invalidateAssetIndex, setAssetWatchActive } from './generator.js';
+import { warmPool, poolStats } from './browser-pool.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -44,6 +45,32 @@ async function getAllAssets(assetsDir, dir = null, basePath = '') {
   return assets.sort();
 }
 
+/**
+ * Watch asset directories recursively, returning false if watching isn't possible.
+ * If a watcher fails later, all of them are closed and onError is called once.
+ */
+function watchAssetDirs(dirs, onChange, onError) {
+  const watchers = [];
+  const closeAll = () => watchers.forEach(watcher => watcher.close());
+
+  try {
+    for (const dir of dirs) {
+      const watcher = watch(dir, { recursive: true }, onChange);
+      watchers.push(watcher);
+      watcher.on('error', (error) => {
+        if (!watchers.length) return;
+        closeAll();
+        watchers.length = 0;
+        onError(error);
+      });
+    }
+    return true;
+  } catch (_e) {
+    closeAll();
+    return false;
+  }
+}
+
 /**
  * Start the Express server
  */
@@ -61,6 +88,25 @@ export async function startServer(port = 8080, options = {}) {
 
   console.log(`Assets directory: ${assetsDir}`);
 
+  const allAssetDirs = [assetsDir];
+  if (assetsDir !== DEFAULT_ASSETS_DIR) allAssetDirs.push(DEFAULT_ASSETS_DIR);
+
+  // Serialized asset listing, cached while the asset dirs are watched for changes
+  let assetListJSON = null;
+  let watching = watchAssetDirs(allAssetDirs, () => {
+    assetListJSON = null;
+    invalidateAssetIndex();
+  }, (error) => {
+    console.warn(`  Warning: Stopped watching asset directories: ${error.message}`);
+    // Changes are no longer seen: stop caching and let lookups re-check the disk
+    watching = false;
+    assetListJSON = null;
+    setAssetWatchActive(false);
+    invalidateAssetIndex();
+  });
+  // With the watcher invalidating the index, lookup misses needn't re-walk it
+  setAssetWatchActive(watching);
+
   // Middleware
   app.use(express.json({ limit: '50mb' }));
 
@@ -82,49 +128,25 @@ export async function startServer(port = 8080, options = {}) {
   // API: List all assets (merge custom + default dirs, deduplicated)
   app.get('/api/assets', async (_req, res) => {
     try {
-      const assets = await getAllAssets(assetsDir);
+      if (assetListJSON) return res.type('json').send(assetListJSON);
+
+      let assets = await getAllAssets(assetsDir);
       if (assetsDir !== DEFAULT_ASSETS_DIR) {
         const defaultAssets = await getAllAssets(DEFAULT_ASSETS_DIR);
-        const merged = [...new Set([...assets, ...defaultAssets])].sort();
-        return res.json(merged);
+        assets = [...new Set([...assets, ...defaultAssets])].sort();
       }
-      res.json(assets);
+      const body = JSON.stringify(assets);
+      if (watching) assetListJSON = body;
+      res.type('json').send(body);
     } catch (error) {
       res.status(500).json({ error: error.message });
     }
   });
 
   // API: Resolve asset by filename (searches all asset dirs recursively)
-  const allAssetDirs = [assetsDir];
-  if (assetsDir !== DEFAULT_ASSETS_DIR) allAssetDirs.push(DEFAULT_ASSETS_DIR);
-
-  async function findAssetByName(name, dirs) {
-    for (const baseDir of dirs) {
-      const found = await searchDirForFile(baseDir, name);
-      if (found) return found;
-    }
-    return null;
-  }
-
-  async function searchDirForFile(dir, name) {
-    try {
-      const entries = await readdir(dir, { withFileTypes: true });
-      for (const entry of entries) {
-        const fullPath = join(dir, entry.name);
-        if (entry.isDirectory()) {
-          const found = await searchDirForFile(fullPath, name);
-          if (found) return found;
-        } else if (entry.name === name) {
-          return fullPath;
-        }
-      }
-    } catch (_e) { /* skip */ }
-    return null;
-  }
-
   app.get('/api/resolve-asset/:name', async (req, res) => {
     try {
-      const filePath = await findAssetByName(req.params.name, allAssetDirs);
+      const filePath = await findAsset(req.params.name);
       if (filePath) {
         return res.sendFile(filePath);
       }
@@ -134,17 +156,30 @@ export async function startServer(port = 8080, options = {}) {
     }
   });
 
-  // API: Export thumbnail
+  // Metrics: browser pool usage
+  app.get('/metrics', (_req, res) => {
+    res.json(poolStats());
+  });
+
+  // API: Export thumbnail (PNG, or JPEG with ?format=jpeg)
   app.post('/api/export', async (req, res) => {
+    let format;
+    try {
+      format = parseFormat(req.query.format || 'png');
+    } catch (error) {
+      return res.status(400).json({ error: error.message });
+    }
+
     try {
       const templateData = req.body;
-      const pngBuffer = await generateThumbnail(templateData);
+      const imageBuffer = await generateThumbnail(templateData, { format });
 
+      // Write the buffer as-is; res.send() would also hash it for an ETag
       res.set({
-        'Content-Type': 'image/png',
-        'Content-Length': pngBuffer.length,
+        'Content-Type': `image/${format}`,
+        'Content-Length': imageBuffer.length,
       });
-      res.send(pngBuffer);
+      res.end(imageBuffer);
     } catch (error) {
       console.error('Export error:', error);
       res.status(500).json({ error: error.message });
@@ -187,15 +222,16 @@ export async function startServer(port = 8080, options = {}) {
   });
 
   // API: Get template
-  app.get('/api/templates/:name', async (req, res) => {
-    try {
-      const { name } = req.params;
-      const templatePath = join(ROOT_DIR, 'templates', `${name}.json`);
-      const content = await readFile(templatePath, 'utf-8');
-      res.json(JSON.parse(content));
-    } catch (error) {
-      res.status(404).json({ error: 'Template not found' });
-    }
+  app.get('/api/templates/:name', (req, res) => {
+    const { name } = req.params;
+
+    // Stream the file as stored rather than parsing and re-serializing it.
+    // root keeps the name inside templates/ (sendFile rejects paths escaping it)
+    res.sendFile(`${name}.json`, { root: join(ROOT_DIR, 'templates'), dotfiles: 'allow' }, (error) => {
+      if (error && !res.headersSent) {
+        res.status(404).json({ error: 'Template not found' });
+      }
+    });
   });
 
   // API: Delete template
@@ -211,8 +247,11 @@ export async function startServer(port = 8080, options = {}) {
     }
   });
 
+  // Launch pooled browsers before accepting requests
+  await warmPool();
+
   // Start server
-  app.listen(port, () => {
+  const server = app.listen(port, () => {
     const url = `http://localhost:${port}`;
     console.log(`\n🎨 Thumbnail Editor running at ${url}\n`);
 
@@ -223,4 +262,8 @@ export async function startServer(port = 8080, options = {}) {
       exec(`${cmd} ${url}`);
     });
   });
+
+  // Keep editor connections open between interactions (Node's default is 5s)
+  server.keepAliveTimeout = 60_000;
+  server.headersTimeout = 61_000;
 }